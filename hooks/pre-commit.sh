@@ -71,6 +71,30 @@ if [ -n "$JSON_FILES" ]; then
   done <<< "$JSON_FILES"
 fi
 
+# Check Python test files
+PY_TEST_FILES="$(printf '%s\n' "$STAGED_FILES" | grep 'test_[^/]*\.py$' || true)"
+if [ -n "$PY_TEST_FILES" ]; then
+  echo "Checking Python test files for duplicates..."
+
+  # Scripts directories are not packages, so two test modules with the same
+  # basename collide on import (or get collected twice if copied verbatim).
+  DUPLICATE_MODULES="$(git ls-files '*test_*.py' | xargs -n1 basename | sort | uniq -d)"
+  if [ -n "$DUPLICATE_MODULES" ]; then
+    echo "❌ Duplicate test modules:"
+    echo "$DUPLICATE_MODULES"
+    exit 1
+  fi
+
+  if command -v python &> /dev/null && python -c "import pytest" 2>/dev/null; then
+    DUPLICATE_TESTS="$(cd skills/multi-agent-orchestration/scripts && python -m pytest --collect-only -q -p no:cacheprovider 2>/dev/null | grep '::' | sort | uniq -d || true)"
+    if [ -n "$DUPLICATE_TESTS" ]; then
+      echo "❌ Tests collected more than once:"
+      echo "$DUPLICATE_TESTS"
+      exit 1
+    fi
+  fi
+fi
+
 # Check Markdown files
 MD_FILES="$(printf '%s\n' "$STAGED_FILES" | grep '\.md$' || true)"
 if [ -n "$MD_FILES" ]; then
@@ -0,0 +1,28 @@
+"""
+Shared pytest configuration for the orchestration script tests.
+
+Hypothesis profiles control how many examples property tests run:
+- dev: 20 examples, no shrink/target phases, fast local iteration (default)
+- ci: 100 examples
+- release: 500 examples
+
+Select a profile with the HYPOTHESIS_PROFILE environment variable (HYP_PROFILE
+is accepted as a shorter alias), e.g. ``HYPOTHESIS_PROFILE=ci python -m pytest``.
+Tests that pin max_examples in their own @settings decorator are not affected.
+"""
+
+import os
+
+from hypothesis import Phase, settings
+
+settings.register_profile(
+    "dev",
+    max_examples=20,
+    deadline=None,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+settings.register_profile("ci", max_examples=100, deadline=None)
+settings.register_profile("release", max_examples=500, deadline=None)
+settings.load_profile(
+    os.environ.get("HYPOTHESIS_PROFILE") or os.environ.get("HYP_PROFILE", "dev")
+)
@@ -47,6 +47,13 @@ VALID_TRANSITIONS = {
     "blocked": ["not_started", "in_progress", "fix_required"],  # NEW: can go to fix_required
 }
 
+# Flattened (from_status, to_status) pairs for constant-time validation
+_VALID_PAIRS = frozenset(
+    (from_status, to_status)
+    for from_status, targets in VALID_TRANSITIONS.items()
+    for to_status in targets
+)
+
 
 def validate_transition(from_status: str, to_status: str) -> bool:
     """
@@ -61,8 +68,7 @@ def validate_transition(from_status: str, to_status: str) -> bool:
     Returns:
         True if transition is valid, False otherwise
     """
-    valid_targets = VALID_TRANSITIONS.get(from_status, [])
-    return to_status in valid_targets
+    return (from_status, to_status) in _VALID_PAIRS
 
 
 @dataclass
@@ -413,6 +419,11 @@ def _extract_dependencies_from_details(details: List[str]) -> List[str]:
     return list(dict.fromkeys(dependencies))
 
 
+# _writes:/_reads: detail markers; the marker name is case-insensitive for ASCII
+_MANIFEST_MARKER_RE = re.compile(r'(?ai:_(writes|reads)):(.*)', re.DOTALL)
+_MANIFEST_SPLIT_RE = re.compile(r'\s*,\s*')
+
+
 def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
     """
     Extract file manifest (writes and reads) from task details.
@@ -432,35 +443,22 @@ def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
     Returns:
         Tuple of (writes, reads) - lists of file paths
     """
-    writes: List[str] = []
-    reads: List[str] = []
+    # Dicts as ordered sets: dedup happens while scanning, in first-seen order
+    writes: Dict[str, None] = {}
+    reads: Dict[str, None] = {}
     
     for detail in details:
-        detail_stripped = detail.strip()
-        
-        # Parse _writes: marker
-        if detail_stripped.lower().startswith('_writes:'):
-            # Extract file list after the marker
-            files_str = detail_stripped[8:].strip()  # len('_writes:') = 8
-            if files_str:
-                # Split by comma and clean up each file path
-                files = [f.strip() for f in files_str.split(',')]
-                writes.extend([f for f in files if f])
+        match = _MANIFEST_MARKER_RE.match(detail.strip())
+        if not match:
+            continue
         
-        # Parse _reads: marker
-        elif detail_stripped.lower().startswith('_reads:'):
-            # Extract file list after the marker
-            files_str = detail_stripped[7:].strip()  # len('_reads:') = 7
-            if files_str:
-                # Split by comma and clean up each file path
-                files = [f.strip() for f in files_str.split(',')]
-                reads.extend([f for f in files if f])
-    
-    # Remove duplicates while preserving order
-    writes = list(dict.fromkeys(writes))
-    reads = list(dict.fromkeys(reads))
+        kind, files_str = match.groups()
+        # Split by comma, trimming whitespace around each file path
+        files = _MANIFEST_SPLIT_RE.split(files_str.strip())
+        target = writes if kind.lower() == 'writes' else reads
+        target.update(dict.fromkeys(f for f in files if f))
     
-    return writes, reads
+    return list(writes), list(reads)
 
 
 def _detect_circular_dependencies(graph: DependencyGraph) -> List[CircularDependencyError]:
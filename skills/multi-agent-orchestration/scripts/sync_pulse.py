@@ -31,6 +31,7 @@ class SyncResult:
     message: str
     pulse_updated: bool = False
     errors: List[str] = field(default_factory=list)
+    document: Optional["PulseDocument"] = None
 
 
 @dataclass
@@ -595,6 +596,24 @@ def build_mental_model(
     )
 
 
+def _sync_pulse_content(
+    pulse_content: str,
+    agent_state: Dict[str, Any],
+    update_mental_model: bool = False
+) -> Optional[PulseDocument]:
+    """
+    Parse PULSE markdown and sync it from agent state.
+    
+    Returns:
+        Updated PulseDocument, or None if the PULSE content could not be parsed
+    """
+    document = parse_pulse(pulse_content)
+    if not document:
+        return None
+    
+    return sync_pulse(agent_state, document, update_mental_model=update_mental_model)
+
+
 def sync_pulse_from_state(
     pulse_content: str,
     agent_state: Dict[str, Any],
@@ -613,38 +632,13 @@ def sync_pulse_from_state(
     
     Requirements: 6.1, 6.3, 6.4, 6.6
     """
-    # Parse existing PULSE document
-    document = parse_pulse(pulse_content)
-    if not document:
-        return pulse_content, False
-    
-    # Update Mental Model if requested (Requirement 6.1)
-    if update_mental_model:
-        new_mental_model = build_mental_model(agent_state, document.mental_model)
-    else:
-        new_mental_model = document.mental_model
-    
-    # Update Narrative Delta (Requirement 6.1)
-    new_narrative = build_narrative_delta(agent_state, document.narrative_delta)
-    
-    # Update Risks & Debt (Requirements 6.1, 6.6)
-    new_risks = build_risks_and_debt(agent_state, document.risks_and_debt)
-    
-    # Update Semantic Anchors
-    new_anchors = build_semantic_anchors(agent_state, document.semantic_anchors)
-    
-    # Create updated document
-    updated_document = PulseDocument(
-        mental_model=new_mental_model,
-        narrative_delta=new_narrative,
-        risks_and_debt=new_risks,
-        semantic_anchors=new_anchors
+    updated_document = _sync_pulse_content(
+        pulse_content, agent_state, update_mental_model=update_mental_model
     )
+    if not updated_document:
+        return pulse_content, False
     
-    # Generate updated content
-    updated_content = generate_pulse(updated_document)
-    
-    return updated_content, True
+    return generate_pulse(updated_document), True
 
 
 
@@ -664,7 +658,7 @@ def sync_pulse_files(
         update_mental_model: Whether to update mental model section
     
     Returns:
-        SyncResult with success status
+        SyncResult with success status and, on success, the synced document
     
     Requirements: 6.1, 6.3, 6.4, 6.6
     """
@@ -710,18 +704,19 @@ def sync_pulse_files(
             errors=[str(e)]
         )
     
-    # Sync
-    updated_content, was_updated = sync_pulse_from_state(
+    # Sync (kept in memory so callers can inspect it without re-parsing)
+    updated_document = _sync_pulse_content(
         pulse_content, agent_state, update_mental_model=update_mental_model
     )
-    
-    if not was_updated:
+    if not updated_document:
         return SyncResult(
             success=False,
             message="Failed to parse PULSE document",
             errors=["Could not parse PULSE document structure"]
         )
     
+    updated_content = generate_pulse(updated_document)
+    
     # Write output
     output_file = output_path or pulse_file_path
     try:
@@ -737,7 +732,8 @@ def sync_pulse_files(
     return SyncResult(
         success=True,
         message=f"Successfully synchronized PULSE document to {output_file}",
-        pulse_updated=True
+        pulse_updated=True,
+        document=updated_document
     )
 
 
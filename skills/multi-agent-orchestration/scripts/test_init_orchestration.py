@@ -10,14 +10,26 @@ Validates: Requirements 1.3, 1.7, 11.5
 
 import os
 import sys
-import json
+import copy
+import concurrent.futures
+import inspect
+from collections import defaultdict
 import tempfile
 import shutil
 from pathlib import Path
-from hypothesis import given, strategies as st, settings, assume
 
-# Add script directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+import pytest
+from hypothesis import given, example, strategies as st, settings, assume
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover
+    from json import loads as _loads
+
+# Add script directory to path (once, even if the module is re-imported)
+_SCRIPT_DIR = str(Path(__file__).resolve().parent)
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
 
 from spec_parser import Task, TaskType, TaskStatus
 from init_orchestration import (
@@ -28,35 +40,53 @@ from init_orchestration import (
 )
 
 
+# Pre-built pools for task fields. Sampling from a fixed pool is a single
+# integer draw, which is much cheaper than drawing variable-length text.
+_TASK_IDS = tuple(f"{i}" for i in range(1, 200)) + tuple(
+    f"{i}.{j}" for i in range(1, 20) for j in range(1, 6)
+)
+
+_DESCRIPTIONS = tuple(
+    f"{verb} {noun} {suffix}"
+    for verb in ("Implement", "Add", "Update", "Fix", "Remove", "Document", "Test", "Rename")
+    for noun in ("parser", "cache layer", "CLI flags", "config loader", "status view", "retry logic", "log output", "window map")
+    for suffix in ("handling", "for v2", "edge cases", "support")
+)
+
+_TASK_TYPES = tuple(TaskType)
+_TASK_STATUSES = tuple(TaskStatus)
+
+_VALID_AGENTS = frozenset({"codex", "gemini", "codex-review"})
+_VALID_CRITICALITY = frozenset({"standard", "complex", "security-sensitive"})
+
+_DESCRIPTION_TEMPLATES = (
+    "Implement {} module",
+    "Perform {} of system",
+    "Review {} changes",
+    "Add {} checks to API",
+)
+
+
 # Strategies for generating test data
 @st.composite
 def task_type_strategy(draw):
     """Generate valid task types"""
-    return draw(st.sampled_from(list(TaskType)))
+    return draw(st.sampled_from(_TASK_TYPES))
+
+
+_TASK_TYPE_STRATEGY = task_type_strategy()
 
 
 @st.composite
-def task_strategy(draw):
+def task_strategy(draw, descriptions=st.sampled_from(_DESCRIPTIONS)):
     """Generate a valid Task object"""
-    task_id = draw(st.text(
-        alphabet="0123456789.",
-        min_size=1,
-        max_size=5
-    ).filter(lambda x: x and x[0].isdigit() and not x.endswith('.')))
-    
-    description = draw(st.text(
-        alphabet="abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -_",
-        min_size=5,
-        max_size=50
-    ))
-    
-    task_type = draw(task_type_strategy())
-    status = draw(st.sampled_from(list(TaskStatus)))
+    task_type = draw(_TASK_TYPE_STRATEGY)
+    status = draw(st.sampled_from(_TASK_STATUSES))
     is_optional = draw(st.booleans())
     
     return Task(
-        task_id=task_id,
-        description=description,
+        task_id=draw(st.sampled_from(_TASK_IDS)),
+        description=draw(descriptions),
         task_type=task_type,
         status=status,
         is_optional=is_optional,
@@ -65,26 +95,23 @@ def task_strategy(draw):
     )
 
 
-@st.composite
-def task_with_security_keywords_strategy(draw):
-    """Generate task with security-related keywords"""
-    keywords = ["security", "auth", "password", "token", "encrypt", "credential"]
-    keyword = draw(st.sampled_from(keywords))
-    
-    task = draw(task_strategy())
-    task.description = f"Implement {keyword} module"
-    return task
+def keyword_description_strategy(keywords):
+    """Generate descriptions by filling a template with one of the keywords"""
+    return st.builds(
+        str.format,
+        st.sampled_from(_DESCRIPTION_TEMPLATES),
+        st.sampled_from(keywords),
+    )
 
 
-@st.composite
-def task_with_complex_keywords_strategy(draw):
-    """Generate task with complexity-related keywords"""
-    keywords = ["refactor", "migration", "integration", "architecture"]
-    keyword = draw(st.sampled_from(keywords))
-    
-    task = draw(task_strategy())
-    task.description = f"Perform {keyword} of system"
-    return task
+# Strategy instances shared by the @given tests
+_TASK_STRATEGY = task_strategy()
+_SECURITY_TASK_STRATEGY = task_strategy(descriptions=keyword_description_strategy(
+    ["security", "auth", "password", "token", "encrypt", "credential"]
+))
+_COMPLEX_TASK_STRATEGY = task_strategy(descriptions=keyword_description_strategy(
+    ["refactor", "migration", "integration", "architecture"]
+))
 
 
 @st.composite
@@ -92,38 +119,39 @@ def dependency_graph_strategy(draw):
     """Generate a set of tasks with dependencies"""
     num_tasks = draw(st.integers(min_value=2, max_value=6))
     
-    tasks = []
-    for i in range(num_tasks):
-        task = Task(
+    # One flag per (task, earlier task) pair: the strict lower triangle of
+    # the adjacency matrix, so dependencies always point backwards (a DAG)
+    pairs = [(i, j) for i in range(num_tasks) for j in range(i)]
+    edges = draw(st.lists(st.booleans(), min_size=len(pairs), max_size=len(pairs)))
+    # Guarantee at least one dependency so every example exercises the property
+    edges[draw(st.integers(min_value=0, max_value=len(pairs) - 1))] = True
+    
+    dependencies = [[] for _ in range(num_tasks)]
+    for (i, j), edge in zip(pairs, edges):
+        if edge:
+            dependencies[i].append(str(j + 1))
+    
+    return [
+        Task(
             task_id=str(i + 1),
             description=f"Task {i + 1}",
             task_type=TaskType.CODE,
             status=TaskStatus.NOT_STARTED,
-            dependencies=[],
+            dependencies=dependencies[i],
             details=[],
         )
-        
-        # Add dependencies to earlier tasks
-        if i > 0 and draw(st.booleans()):
-            dep_count = draw(st.integers(min_value=1, max_value=min(i, 2)))
-            deps = draw(st.lists(
-                st.integers(min_value=1, max_value=i),
-                min_size=dep_count,
-                max_size=dep_count,
-                unique=True
-            ))
-            task.dependencies = [str(d) for d in deps]
-        
-        tasks.append(task)
-    
-    return tasks
+        for i in range(num_tasks)
+    ]
 
 
 # Property 2: Agent Assignment by Task Type - REMOVED
 # Now Codex assigns owner_agent via Step 1b of SKILL.md
 # assign_owner_agent() is a legacy fallback that always returns "codex"
-@given(task=task_strategy())
-@settings(max_examples=100, deadline=None)
+@given(task=_TASK_STRATEGY)
+@example(task=Task(task_id="1", description="x", task_type=TaskType.CODE, status=TaskStatus.NOT_STARTED))
+@example(task=Task(task_id="1", description="x", task_type=TaskType.UI, status=TaskStatus.NOT_STARTED))
+@example(task=Task(task_id="1", description="x", task_type=TaskType.REVIEW, status=TaskStatus.NOT_STARTED))
+@settings(max_examples=10, deadline=None)
 def test_property_2_agent_assignment_by_task_type(task):
     """
     Property 2: Agent Assignment (Legacy Fallback)
@@ -139,26 +167,29 @@ def test_property_2_agent_assignment_by_task_type(task):
         f"Legacy assign_owner_agent should return 'codex', got {assigned_agent}"
 
 
-@given(task_type=task_type_strategy())
-@settings(max_examples=100, deadline=None)
-def test_agent_assignment_exhaustive(task_type):
+def test_agent_assignment_exhaustive():
     """Test all task types return 'codex' (legacy fallback)."""
-    task = Task(
-        task_id="1",
-        description="Test task",
-        task_type=task_type,
-        status=TaskStatus.NOT_STARTED,
-    )
-    
-    agent = assign_owner_agent(task)
+    assignments = {
+        task_type: assign_owner_agent(Task(
+            task_id="1",
+            description="Test task",
+            task_type=task_type,
+            status=TaskStatus.NOT_STARTED,
+        ))
+        for task_type in TaskType
+    }
     
     # Legacy fallback always returns codex regardless of task type
-    assert agent == "codex", f"Expected 'codex', got {agent}"
+    assert assignments == {
+        TaskType.CODE: "codex",
+        TaskType.UI: "codex",
+        TaskType.REVIEW: "codex",
+    }, f"Expected 'codex' for every task type, got {assignments}"
 
 
 # Property 3: Dependency-Based Blocking
 @given(tasks=dependency_graph_strategy())
-@settings(max_examples=100, deadline=None)
+@settings(deadline=None)
 def test_property_3_dependency_based_blocking(tasks):
     """
     Property 3: Dependency-Based Blocking
@@ -169,8 +200,11 @@ def test_property_3_dependency_based_blocking(tasks):
     Feature: multi-agent-orchestration, Property 3
     Validates: Requirements 1.7
     """
-    # Build task map
-    task_map = {t.task_id: t for t in tasks}
+    assume(any(t.dependencies for t in tasks))
+    
+    # Build status map; unknown dependencies count as completed
+    task_map = {t.task_id: t.status for t in tasks}
+    completed_ids = {t.task_id for t in tasks if t.status == TaskStatus.COMPLETED}
     
     for task in tasks:
         if not task.dependencies:
@@ -178,7 +212,7 @@ def test_property_3_dependency_based_blocking(tasks):
         
         # Check if all dependencies are completed
         all_deps_completed = all(
-            task_map.get(dep_id, Task(task_id=dep_id, description="", status=TaskStatus.COMPLETED)).status == TaskStatus.COMPLETED
+            dep_id in completed_ids or dep_id not in task_map
             for dep_id in task.dependencies
         )
         
@@ -189,8 +223,8 @@ def test_property_3_dependency_based_blocking(tasks):
                 f"Task {task.task_id} has incomplete dependencies but status is {task.status}"
 
 
-@given(task=task_with_security_keywords_strategy())
-@settings(max_examples=100, deadline=None)
+@given(task=_SECURITY_TASK_STRATEGY)
+@settings(deadline=None)
 def test_security_criticality_detection(task):
     """Test security keywords trigger security-sensitive criticality."""
     criticality = determine_criticality(task)
@@ -198,8 +232,8 @@ def test_security_criticality_detection(task):
         f"Task with security keyword should be security-sensitive, got {criticality}"
 
 
-@given(task=task_with_complex_keywords_strategy())
-@settings(max_examples=100, deadline=None)
+@given(task=_COMPLEX_TASK_STRATEGY)
+@settings(deadline=None)
 def test_complex_criticality_detection(task):
     """Test complex keywords trigger complex criticality."""
     criticality = determine_criticality(task)
@@ -209,8 +243,8 @@ def test_complex_criticality_detection(task):
         f"Task with complex keyword should be complex or security-sensitive, got {criticality}"
 
 
-@given(task=task_strategy())
-@settings(max_examples=100, deadline=None)
+@given(task=_TASK_STRATEGY)
+@settings(deadline=None)
 def test_task_entry_conversion(task):
     """Test task conversion preserves all fields."""
     entry = convert_task_to_entry(task)
@@ -225,57 +259,74 @@ def test_task_entry_conversion(task):
     assert entry.criticality is None
 
 
-@given(task=task_strategy())
-@settings(max_examples=100, deadline=None)
+@given(task=_TASK_STRATEGY)
+@settings(deadline=None)
 def test_task_entry_conversion_legacy(task):
     """Test legacy task conversion includes decision fields."""
     entry = convert_task_to_entry(task, include_decisions=True)
     
-    assert entry.owner_agent in {"codex", "gemini", "codex-review"}
-    assert entry.criticality in {"standard", "complex", "security-sensitive"}
+    assert entry.owner_agent in _VALID_AGENTS
+    assert entry.criticality in _VALID_CRITICALITY
 
 
-def test_initialization_with_valid_spec():
-    """Integration test: Initialize from a valid spec directory."""
-    # Create temp spec directory
-    with tempfile.TemporaryDirectory() as tmpdir:
-        spec_path = Path(tmpdir) / "test-spec"
-        spec_path.mkdir()
-        
-        # Create minimal spec files
-        (spec_path / "requirements.md").write_text("# Requirements\n\nTest requirements.")
-        (spec_path / "design.md").write_text("# Design\n\n## Overview\n\nTest design.")
-        (spec_path / "tasks.md").write_text("""# Tasks
+@pytest.fixture(scope="session")
+def initialized_spec(tmp_path_factory):
+    """Initialize a valid spec directory once and share the result."""
+    spec_path = tmp_path_factory.mktemp("spec", numbered=False) / "test-spec"
+    spec_path.mkdir()
+    
+    # Create minimal spec files
+    (spec_path / "requirements.md").write_text("# Requirements\n\nTest requirements.")
+    (spec_path / "design.md").write_text("# Design\n\n## Overview\n\nTest design.")
+    (spec_path / "tasks.md").write_text("""# Tasks
 
 - [ ] 1 Implement feature A
 - [ ] 2 Implement feature B
   - dependencies: 1
 """)
-        
-        # Initialize
-        result = initialize_orchestration(str(spec_path), mode="codex")
-        
-        assert result.success, f"Initialization failed: {result.errors}"
-        assert result.tasks_file is not None
-        assert result.state_file is not None
-        assert result.pulse_file is not None
-        
-        # Verify state file
-        with open(result.state_file) as f:
-            state = json.load(f)
-        
-        assert state["spec_path"] == str(spec_path.absolute())
-        assert len(state["tasks"]) == 2
-        assert state["tasks"][0]["task_id"] == "1"
-        assert state["tasks"][1]["task_id"] == "2"
-        assert "owner_agent" not in state["tasks"][0]
-        assert "criticality" not in state["tasks"][0]
-        
-        # Verify TASKS_PARSED.json exists
-        assert os.path.exists(result.tasks_file)
-        
-        # Verify PULSE file exists
-        assert os.path.exists(result.pulse_file)
+    
+    # Initialize
+    result = initialize_orchestration(str(spec_path), mode="codex")
+    assert result.success, f"Initialization failed: {result.errors}"
+    
+    state = _loads(Path(result.state_file).read_text())
+    
+    return spec_path, result, state
+
+
+def test_initialization_with_valid_spec(initialized_spec):
+    """Integration test: Initialize from a valid spec directory."""
+    _, result, _ = initialized_spec
+    
+    assert result.tasks_file is not None
+    assert result.state_file is not None
+    assert result.pulse_file is not None
+
+
+def test_state_file_contains_tasks(initialized_spec):
+    """Integration test: State file lists parsed tasks without decision fields."""
+    _, _, state = initialized_spec
+    
+    assert len(state["tasks"]) == 2
+    assert state["tasks"][0]["task_id"] == "1"
+    assert state["tasks"][1]["task_id"] == "2"
+    assert "owner_agent" not in state["tasks"][0]
+    assert "criticality" not in state["tasks"][0]
+
+
+def test_spec_path_recorded(initialized_spec):
+    """Integration test: State file records the absolute spec path."""
+    spec_path, _, state = initialized_spec
+    
+    assert state["spec_path"] == str(spec_path.absolute())
+
+
+def test_pulse_file_exists(initialized_spec):
+    """Integration test: TASKS_PARSED.json and PULSE file are written."""
+    _, result, _ = initialized_spec
+    
+    assert os.path.exists(result.tasks_file)
+    assert os.path.exists(result.pulse_file)
 
 
 def test_initialization_with_legacy_mode_sets_decisions():
@@ -296,8 +347,7 @@ def test_initialization_with_legacy_mode_sets_decisions():
         
         assert result.success, f"Initialization failed: {result.errors}"
         
-        with open(result.state_file) as f:
-            state = json.load(f)
+        state = _loads(Path(result.state_file).read_text())
         
         assert "owner_agent" in state["tasks"][0]
         assert "criticality" in state["tasks"][0]
@@ -315,6 +365,40 @@ def test_initialization_with_invalid_spec():
 
 # Tests for dispatch failure rollback behavior
 
+# Base AGENT_STATE shared by the dispatch tests; tasks are supplied per test
+_BASE_STATE = {
+    "spec_path": "/test/spec",
+    "session_name": "test-session",
+    "tasks": [],
+    "review_findings": [],
+    "final_reports": [],
+    "blocked_items": [],
+    "pending_decisions": [],
+    "deferred_fixes": [],
+    "window_mapping": {},
+}
+
+
+def _make_state(tasks):
+    """Build a fresh AGENT_STATE dict from the base template."""
+    return {**copy.deepcopy(_BASE_STATE), "tasks": tasks}
+
+
+# Dispatch fails fast when the wrapper is missing, so the state never needs
+# to touch disk; keep it in a dict keyed by the state file path instead.
+_STATE_FILE = "/fake/AGENT_STATE.json"
+_MISSING_WRAPPER = "/fake/missing-codeagent-wrapper"
+
+
+def _use_in_memory_state(monkeypatch, module, initial_state):
+    """Patch module's load/save_agent_state to a dict-backed store."""
+    store = {_STATE_FILE: copy.deepcopy(initial_state)}
+    monkeypatch.setattr(module, "load_agent_state", lambda path: copy.deepcopy(store[path]))
+    monkeypatch.setattr(module, "save_agent_state", lambda path, state: store.__setitem__(path, copy.deepcopy(state)))
+    monkeypatch.setenv("CODEAGENT_WRAPPER", _MISSING_WRAPPER)
+    return store
+
+
 def test_dispatch_batch_failure_keeps_tasks_not_started(monkeypatch):
     """
     Test that failed dispatch does not leave tasks stuck in in_progress.
@@ -322,46 +406,29 @@ def test_dispatch_batch_failure_keeps_tasks_not_started(monkeypatch):
     P1 Fix: Tasks should remain not_started when dispatch fails completely,
     allowing retry without manual state edits.
     """
-    from dispatch_batch import dispatch_batch, load_agent_state
+    import dispatch_batch as module
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        state_file = Path(tmpdir) / "AGENT_STATE.json"
-        monkeypatch.setenv("CODEAGENT_WRAPPER", str(Path(tmpdir) / "missing-codeagent-wrapper"))
-        
-        # Create initial state with tasks
-        initial_state = {
-            "spec_path": "/test/spec",
-            "session_name": "test-session",
-            "tasks": [
-                {"task_id": "1", "description": "Task 1", "status": "not_started",
-                 "owner_agent": "codex", "target_window": "codex",
-                 "dependencies": [], "criticality": "standard"},
-                {"task_id": "2", "description": "Task 2", "status": "not_started",
-                 "owner_agent": "codex", "target_window": "codex",
-                 "dependencies": [], "criticality": "standard"},
-            ],
-            "review_findings": [],
-            "final_reports": [],
-            "blocked_items": [],
-            "pending_decisions": [],
-            "deferred_fixes": [],
-            "window_mapping": {},
-        }
-        
-        with open(state_file, 'w') as f:
-            json.dump(initial_state, f)
-        
-        # Dispatch will fail because codeagent-wrapper is not in PATH
-        result = dispatch_batch(str(state_file))
-        
-        # Verify dispatch failed
-        assert not result.success, "Dispatch should fail when codeagent-wrapper not found"
-        
-        # Verify tasks are still not_started (not stuck in in_progress)
-        final_state = load_agent_state(str(state_file))
-        for task in final_state["tasks"]:
-            assert task["status"] == "not_started", \
-                f"Task {task['task_id']} should remain not_started after failed dispatch, got {task['status']}"
+    # Create initial state with tasks
+    initial_state = _make_state([
+        {"task_id": "1", "description": "Task 1", "status": "not_started",
+         "owner_agent": "codex", "target_window": "codex",
+         "dependencies": [], "criticality": "standard"},
+        {"task_id": "2", "description": "Task 2", "status": "not_started",
+         "owner_agent": "codex", "target_window": "codex",
+         "dependencies": [], "criticality": "standard"},
+    ])
+    store = _use_in_memory_state(monkeypatch, module, initial_state)
+    
+    # Dispatch will fail because codeagent-wrapper is not in PATH
+    result = module.dispatch_batch(_STATE_FILE)
+    
+    # Verify dispatch failed
+    assert not result.success, "Dispatch should fail when codeagent-wrapper not found"
+    
+    # Verify tasks are still not_started (not stuck in in_progress)
+    for task in store[_STATE_FILE]["tasks"]:
+        assert task["status"] == "not_started", \
+            f"Task {task['task_id']} should remain not_started after failed dispatch, got {task['status']}"
 
 
 def test_fix_dispatch_failure_reports_errors(monkeypatch):
@@ -370,51 +437,34 @@ def test_fix_dispatch_failure_reports_errors(monkeypatch):
     
     P1 Fix: Fix dispatch failure should return success False with error details.
     """
-    from dispatch_batch import dispatch_batch, load_agent_state
-    
-    with tempfile.TemporaryDirectory() as tmpdir:
-        state_file = Path(tmpdir) / "AGENT_STATE.json"
-        monkeypatch.setenv("CODEAGENT_WRAPPER", str(Path(tmpdir) / "missing-codeagent-wrapper"))
-        
-        initial_state = {
-            "spec_path": "/test/spec",
-            "session_name": "test-session",
-            "tasks": [
-                {"task_id": "1", "description": "Fix task", "status": "fix_required",
-                 "owner_agent": "codex", "target_window": "codex",
-                 "dependencies": [], "criticality": "standard",
-                 "fix_attempts": 0, "last_review_severity": "major",
-                 "review_history": [{
-                     "attempt": 0,
-                     "severity": "major",
-                     "findings": [{"severity": "major", "summary": "Bug found"}],
-                     "reviewed_at": "2026-01-08T10:00:00Z"
-                 }]},
-            ],
-            "review_findings": [],
-            "final_reports": [],
-            "blocked_items": [],
-            "pending_decisions": [],
-            "deferred_fixes": [],
-            "window_mapping": {},
-        }
-        
-        with open(state_file, 'w') as f:
-            json.dump(initial_state, f)
-        
-        result = dispatch_batch(str(state_file))
-        
-        assert not result.success, "Fix dispatch failure should return success=False"
-        assert result.errors, "Fix dispatch failure should surface errors"
-        assert result.execution_report is not None, \
-            "Execution report should include fix dispatch failure"
-        assert result.execution_report.tasks_failed >= 1, \
-            "Fix dispatch failure should count as failed"
-        
-        final_state = load_agent_state(str(state_file))
-        task = next(t for t in final_state["tasks"] if t["task_id"] == "1")
-        assert task["status"] == "fix_required", \
-            "Fix task should roll back to fix_required after failed dispatch"
+    import dispatch_batch as module
+    
+    initial_state = _make_state([
+        {"task_id": "1", "description": "Fix task", "status": "fix_required",
+         "owner_agent": "codex", "target_window": "codex",
+         "dependencies": [], "criticality": "standard",
+         "fix_attempts": 0, "last_review_severity": "major",
+         "review_history": [{
+             "attempt": 0,
+             "severity": "major",
+             "findings": [{"severity": "major", "summary": "Bug found"}],
+             "reviewed_at": "2026-01-08T10:00:00Z"
+         }]},
+    ])
+    store = _use_in_memory_state(monkeypatch, module, initial_state)
+    
+    result = module.dispatch_batch(_STATE_FILE)
+    
+    assert not result.success, "Fix dispatch failure should return success=False"
+    assert result.errors, "Fix dispatch failure should surface errors"
+    assert result.execution_report is not None, \
+        "Execution report should include fix dispatch failure"
+    assert result.execution_report.tasks_failed >= 1, \
+        "Fix dispatch failure should count as failed"
+    
+    task = next(t for t in store[_STATE_FILE]["tasks"] if t["task_id"] == "1")
+    assert task["status"] == "fix_required", \
+        "Fix task should roll back to fix_required after failed dispatch"
 
 
 def test_dispatch_batch_partial_failure_handles_results():
@@ -432,22 +482,12 @@ def test_dispatch_batch_partial_failure_handles_results():
         state_file = Path(tmpdir) / "AGENT_STATE.json"
         
         # Create initial state
-        initial_state = {
-            "spec_path": "/test/spec",
-            "session_name": "test-session",
-            "tasks": [
-                {"task_id": "1", "description": "Task 1", "status": "not_started",
-                 "owner_agent": "codex", "dependencies": [], "criticality": "standard"},
-                {"task_id": "2", "description": "Task 2", "status": "not_started",
-                 "owner_agent": "codex", "dependencies": [], "criticality": "standard"},
-            ],
-            "review_findings": [],
-            "final_reports": [],
-            "blocked_items": [],
-            "pending_decisions": [],
-            "deferred_fixes": [],
-            "window_mapping": {},
-        }
+        initial_state = _make_state([
+            {"task_id": "1", "description": "Task 1", "status": "not_started",
+             "owner_agent": "codex", "dependencies": [], "criticality": "standard"},
+            {"task_id": "2", "description": "Task 2", "status": "not_started",
+             "owner_agent": "codex", "dependencies": [], "criticality": "standard"},
+        ])
         
         # Simulate partial failure: task 1 completed, task 2 failed
         report = ExecutionReport(
@@ -488,44 +528,27 @@ def test_dispatch_reviews_failure_keeps_tasks_pending_review(monkeypatch):
     P1 Fix: Tasks should remain pending_review when dispatch fails completely,
     allowing retry without manual state edits.
     """
-    from dispatch_reviews import dispatch_reviews, load_agent_state
+    import dispatch_reviews as module
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        state_file = Path(tmpdir) / "AGENT_STATE.json"
-        monkeypatch.setenv("CODEAGENT_WRAPPER", str(Path(tmpdir) / "missing-codeagent-wrapper"))
-        
-        # Create initial state with tasks pending review
-        initial_state = {
-            "spec_path": "/test/spec",
-            "session_name": "test-session",
-            "tasks": [
-                {"task_id": "1", "description": "Task 1", "status": "pending_review",
-                 "criticality": "standard"},
-                {"task_id": "2", "description": "Task 2", "status": "pending_review",
-                 "criticality": "complex"},
-            ],
-            "review_findings": [],
-            "final_reports": [],
-            "blocked_items": [],
-            "pending_decisions": [],
-            "deferred_fixes": [],
-            "window_mapping": {},
-        }
-        
-        with open(state_file, 'w') as f:
-            json.dump(initial_state, f)
-        
-        # Dispatch will fail because codeagent-wrapper is not in PATH
-        result = dispatch_reviews(str(state_file))
-        
-        # Verify dispatch failed
-        assert not result.success, "Review dispatch should fail when codeagent-wrapper not found"
-        
-        # Verify tasks are still pending_review (not stuck in under_review)
-        final_state = load_agent_state(str(state_file))
-        for task in final_state["tasks"]:
-            assert task["status"] == "pending_review", \
-                f"Task {task['task_id']} should remain pending_review after failed dispatch, got {task['status']}"
+    # Create initial state with tasks pending review
+    initial_state = _make_state([
+        {"task_id": "1", "description": "Task 1", "status": "pending_review",
+         "criticality": "standard"},
+        {"task_id": "2", "description": "Task 2", "status": "pending_review",
+         "criticality": "complex"},
+    ])
+    store = _use_in_memory_state(monkeypatch, module, initial_state)
+    
+    # Dispatch will fail because codeagent-wrapper is not in PATH
+    result = module.dispatch_reviews(_STATE_FILE)
+    
+    # Verify dispatch failed
+    assert not result.success, "Review dispatch should fail when codeagent-wrapper not found"
+    
+    # Verify tasks are still pending_review (not stuck in under_review)
+    for task in store[_STATE_FILE]["tasks"]:
+        assert task["status"] == "pending_review", \
+            f"Task {task['task_id']} should remain pending_review after failed dispatch, got {task['status']}"
 
 
 def test_dispatch_reviews_partial_failure_handles_results():
@@ -540,22 +563,12 @@ def test_dispatch_reviews_partial_failure_handles_results():
     )
     
     # Create initial state with tasks pending review
-    state = {
-        "spec_path": "/test/spec",
-        "session_name": "test-session",
-        "tasks": [
-            {"task_id": "task-001", "description": "Task 1", "status": "pending_review",
-             "criticality": "standard"},
-            {"task_id": "task-002", "description": "Task 2", "status": "pending_review",
-             "criticality": "standard"},
-        ],
-        "review_findings": [],
-        "final_reports": [],
-        "blocked_items": [],
-        "pending_decisions": [],
-        "deferred_fixes": [],
-        "window_mapping": {},
-    }
+    state = _make_state([
+        {"task_id": "task-001", "description": "Task 1", "status": "pending_review",
+         "criticality": "standard"},
+        {"task_id": "task-002", "description": "Task 2", "status": "pending_review",
+         "criticality": "standard"},
+    ])
     
     # Simulate partial failure: task-001 review completed, task-002 failed
     report = ReviewReport(
@@ -593,63 +606,107 @@ def test_dispatch_reviews_partial_failure_handles_results():
         f"task-002 should remain pending_review (no result), got {task2['status']}"
 
 
-def test_review_id_parsing_with_dashed_task_id():
+_REVIEW_PREFIX_LEN = len("review-")
+
+
+@pytest.mark.parametrize("review_id,task_id,idx", [
+    ("review-task-001-1", "task-001", "1"),
+    ("review-42-2", "42", "2"),
+    ("review-x-y-z-7", "x-y-z", "7"),
+    ("review-a-0", "a", "0"),
+])
+def test_review_id_parsing_with_dashed_task_id(review_id, task_id, idx):
     """
     Test that review_id parsing correctly handles task_ids containing dashes.
     
     P2 Fix: task_id like "task-001" should not be truncated when parsing review_id.
     """
-    # Test the parsing logic directly
-    review_id = "review-task-001-1"
-    
     # Correct parsing: remove prefix, rsplit from right
-    remainder = review_id[len("review-"):]  # "task-001-1"
-    parts = remainder.rsplit("-", 1)  # ["task-001", "1"]
-    
-    assert len(parts) == 2, f"Should split into 2 parts, got {parts}"
-    assert parts[0] == "task-001", f"Task ID should be 'task-001', got {parts[0]}"
-    assert parts[1] == "1", f"Reviewer index should be '1', got {parts[1]}"
+    remainder = review_id[_REVIEW_PREFIX_LEN:]
+    parts = remainder.rsplit("-", 1)
     
-    # Test with simple task_id too
-    review_id2 = "review-42-2"
-    remainder2 = review_id2[len("review-"):]
-    parts2 = remainder2.rsplit("-", 1)
-    
-    assert parts2[0] == "42", f"Task ID should be '42', got {parts2[0]}"
-    assert parts2[1] == "2", f"Reviewer index should be '2', got {parts2[1]}"
+    assert parts == [task_id, idx], \
+        f"Expected task ID {task_id!r} and reviewer index {idx!r}, got {parts}"
+
+
+def _init_script_worker():
+    """Script runner worker setup: no shared example database, so the
+    parallel workers never contend on SQLite."""
+    settings.register_profile("script", database=None)
+    settings.load_profile("script")
+
+
+def _run(name_test):
+    """Run a single (name, test function name) pair in a worker process."""
+    name, test_name = name_test
+    try:
+        globals()[test_name]()
+        return name, None
+    except Exception as e:
+        return name, str(e)
 
 
 if __name__ == "__main__":
+    # Usage: python test_init_orchestration.py [--x] [name ...]
+    # Names select a subset of TESTS; --x stops at the first failure.
+    TESTS = {
+        "prop2_agent_assignment": ("Property 2: Agent Assignment by Task Type", test_property_2_agent_assignment_by_task_type),
+        "prop3_dependency_blocking": ("Property 3: Dependency-Based Blocking", test_property_3_dependency_based_blocking),
+        "agent_assignment_exhaustive": ("Agent Assignment Exhaustive", test_agent_assignment_exhaustive),
+        "security_criticality": ("Security Criticality Detection", test_security_criticality_detection),
+        "complex_criticality": ("Complex Criticality Detection", test_complex_criticality_detection),
+        "task_entry_conversion": ("Task Entry Conversion", test_task_entry_conversion),
+        "task_entry_conversion_legacy": ("Task Entry Conversion Legacy", test_task_entry_conversion_legacy),
+        "valid_spec": ("Integration: Valid Spec", test_initialization_with_valid_spec),
+        "state_file_tasks": ("Integration: State File Contains Tasks", test_state_file_contains_tasks),
+        "spec_path_recorded": ("Integration: Spec Path Recorded", test_spec_path_recorded),
+        "pulse_file_exists": ("Integration: PULSE File Exists", test_pulse_file_exists),
+        "legacy_mode": ("Integration: Legacy Mode", test_initialization_with_legacy_mode_sets_decisions),
+        "invalid_spec": ("Integration: Invalid Spec", test_initialization_with_invalid_spec),
+        "dispatch_batch_failure": ("P1 Fix: Dispatch Batch Failure Rollback", test_dispatch_batch_failure_keeps_tasks_not_started),
+        "dispatch_batch_partial": ("P3 Coverage: Dispatch Batch Partial Failure", test_dispatch_batch_partial_failure_handles_results),
+        "dispatch_reviews_failure": ("P1 Fix: Dispatch Reviews Failure Rollback", test_dispatch_reviews_failure_keeps_tasks_pending_review),
+        "dispatch_reviews_partial": ("P3 Coverage: Dispatch Reviews Partial Failure", test_dispatch_reviews_partial_failure_handles_results),
+        "fix_dispatch_failure": ("P1 Fix: Fix Dispatch Failure Reports Errors", test_fix_dispatch_failure_reports_errors),
+        "review_id_dashed_task_id": ("P2 Fix: Review ID Parsing with Dashed Task ID", test_review_id_parsing_with_dashed_task_id),
+    }
+    
+    args = sys.argv[1:]
+    exit_first = "--x" in args
+    selected = [arg for arg in args if arg != "--x"] or list(TESTS)
+    unknown = [name for name in selected if name not in TESTS]
+    if unknown:
+        print(f"Unknown test(s): {', '.join(unknown)}")
+        print(f"Available: {', '.join(TESTS)}")
+        sys.exit(2)
+    
     print("Running property tests for initialization...")
     print("=" * 60)
     
-    tests = [
-        ("Property 2: Agent Assignment by Task Type", test_property_2_agent_assignment_by_task_type),
-        ("Property 3: Dependency-Based Blocking", test_property_3_dependency_based_blocking),
-        ("Agent Assignment Exhaustive", test_agent_assignment_exhaustive),
-        ("Security Criticality Detection", test_security_criticality_detection),
-        ("Complex Criticality Detection", test_complex_criticality_detection),
-        ("Task Entry Conversion", test_task_entry_conversion),
-        ("Task Entry Conversion Legacy", test_task_entry_conversion_legacy),
-        ("Integration: Valid Spec", test_initialization_with_valid_spec),
-        ("Integration: Legacy Mode", test_initialization_with_legacy_mode_sets_decisions),
-        ("Integration: Invalid Spec", test_initialization_with_invalid_spec),
-        ("P1 Fix: Dispatch Batch Failure Rollback", test_dispatch_batch_failure_keeps_tasks_not_started),
-        ("P3 Coverage: Dispatch Batch Partial Failure", test_dispatch_batch_partial_failure_handles_results),
-        ("P1 Fix: Dispatch Reviews Failure Rollback", test_dispatch_reviews_failure_keeps_tasks_pending_review),
-        ("P3 Coverage: Dispatch Reviews Partial Failure", test_dispatch_reviews_partial_failure_handles_results),
-        ("P2 Fix: Review ID Parsing with Dashed Task ID", test_review_id_parsing_with_dashed_task_id),
-    ]
+    # Tests that take pytest fixtures (monkeypatch, initialized_spec) or
+    # parametrize arguments only run under pytest
+    skipped = [name for name in selected if inspect.signature(TESTS[name][1]).parameters]
+    for name in skipped:
+        fixtures = ", ".join(inspect.signature(TESTS[name][1]).parameters)
+        print(f"\n{TESTS[name][0]}")
+        print(f"  ⏭️  SKIPPED (needs pytest fixtures: {fixtures}; run with pytest)")
     
+    # Tests are independent, so run them in parallel worker processes
     failed = []
-    for name, test in tests:
-        try:
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count(), initializer=_init_script_worker
+    ) as executor:
+        jobs = [(TESTS[name][0], TESTS[name][1].__name__) for name in selected if name not in skipped]
+        for name, error in executor.map(_run, jobs):
             print(f"\n{name}")
-            test()
-            print("  ✅ PASSED")
-        except Exception as e:
-            print(f"  ❌ FAILED: {e}")
-            failed.append((name, str(e)))
+            if error is None:
+                print("  ✅ PASSED")
+                continue
+            print(f"  ❌ FAILED: {error}")
+            failed.append((name, error))
+            if exit_first:
+                executor.shutdown(wait=False, cancel_futures=True)
+                break
     
     print("\n" + "=" * 60)
     if failed:
@@ -658,7 +715,8 @@ if __name__ == "__main__":
             print(f"   - {name}: {error}")
         sys.exit(1)
     else:
-        print(f"✅ All {len(tests)} tests passed!")
+        print(f"✅ All {len(selected) - len(skipped)} tests passed!"
+              + (f" ({len(skipped)} skipped)" if skipped else ""))
 
 
 # ============================================================================
@@ -670,18 +728,31 @@ if __name__ == "__main__":
 
 from init_orchestration import update_parent_statuses
 
+# Interned ".N" suffixes for building subtask ids without per-draw formatting
+_SUFFIX = tuple(f".{i}" for i in range(1, 16))
+
+_ALL_STATUSES = (
+    "not_started", "in_progress", "pending_review",
+    "under_review", "final_review", "completed", "blocked",
+)
+# Subtask statuses that roll a parent up to "in_progress"
+_IN_PROGRESS_STATUSES = frozenset({"in_progress", "pending_review", "under_review", "final_review"})
+_IN_PROGRESS_STATUS_STRATEGY = st.sampled_from(sorted(_IN_PROGRESS_STATUSES))
+_UNBLOCKED_STATUS_STRATEGY = st.sampled_from([s for s in _ALL_STATUSES if s != "blocked"])
+
 
 @st.composite
 def parent_with_subtasks_state_strategy(draw):
     """Generate a state with parent tasks and subtasks."""
-    num_parents = draw(st.integers(min_value=1, max_value=3))
+    # Three-parent states are covered by an explicit example on the test
+    num_parents = draw(st.integers(min_value=1, max_value=2))
     
     tasks = []
     
     for p in range(1, num_parents + 1):
         parent_id = str(p)
         num_subtasks = draw(st.integers(min_value=1, max_value=4))
-        subtask_ids = [f"{parent_id}.{s}" for s in range(1, num_subtasks + 1)]
+        subtask_ids = [parent_id + _SUFFIX[s - 1] for s in range(1, num_subtasks + 1)]
         
         # Create parent task
         parent = {
@@ -695,10 +766,7 @@ def parent_with_subtasks_state_strategy(draw):
         # Create subtasks with random statuses
         subtask_statuses = []
         for sid in subtask_ids:
-            status = draw(st.sampled_from([
-                "not_started", "in_progress", "pending_review", 
-                "under_review", "final_review", "completed", "blocked"
-            ]))
+            status = draw(st.sampled_from(_ALL_STATUSES))
             subtask_statuses.append(status)
             subtask = {
                 "task_id": sid,
@@ -713,76 +781,38 @@ def parent_with_subtasks_state_strategy(draw):
 
 
 @st.composite
-def all_completed_subtasks_strategy(draw):
-    """Generate a state where all subtasks are completed."""
-    parent_id = "1"
-    num_subtasks = draw(st.integers(min_value=1, max_value=4))
-    subtask_ids = [f"{parent_id}.{s}" for s in range(1, num_subtasks + 1)]
+def parent_subtask_scenario_strategy(draw):
+    """Generate a single parent whose subtasks trigger one aggregation rule.
     
-    tasks = [
-        {
-            "task_id": parent_id,
-            "description": "Parent task",
-            "status": "not_started",
-            "subtasks": subtask_ids,
-        }
-    ]
-    
-    for sid in subtask_ids:
-        tasks.append({
-            "task_id": sid,
-            "description": f"Subtask {sid}",
-            "status": "completed",
-            "parent_id": parent_id,
-            "subtasks": [],
-        })
-    
-    return {"tasks": tasks, "parent_id": parent_id}
-
-
-@st.composite
-def some_in_progress_subtasks_strategy(draw):
-    """Generate a state where some subtasks are in progress."""
-    parent_id = "1"
-    num_subtasks = draw(st.integers(min_value=2, max_value=4))
-    subtask_ids = [f"{parent_id}.{s}" for s in range(1, num_subtasks + 1)]
-    
-    tasks = [
-        {
-            "task_id": parent_id,
-            "description": "Parent task",
-            "status": "not_started",
-            "subtasks": subtask_ids,
-        }
-    ]
-    
-    # At least one in_progress, rest can be anything except blocked
-    in_progress_statuses = ["in_progress", "pending_review", "under_review", "final_review"]
-    
-    for i, sid in enumerate(subtask_ids):
-        if i == 0:
-            status = draw(st.sampled_from(in_progress_statuses))
-        else:
-            status = draw(st.sampled_from(["not_started", "completed"] + in_progress_statuses))
-        
-        tasks.append({
-            "task_id": sid,
-            "description": f"Subtask {sid}",
-            "status": status,
-            "parent_id": parent_id,
-            "subtasks": [],
-        })
-    
-    return {"tasks": tasks, "parent_id": parent_id}
-
-
-@st.composite
-def some_blocked_subtasks_strategy(draw):
-    """Generate a state where some subtasks are blocked."""
+    The returned state carries the drawn rule as "expected", the parent
+    status update_parent_statuses should derive.
+    """
     parent_id = "1"
-    num_subtasks = draw(st.integers(min_value=2, max_value=4))
-    subtask_ids = [f"{parent_id}.{s}" for s in range(1, num_subtasks + 1)]
+    expected = draw(st.sampled_from(["completed", "in_progress", "blocked"]))
     
+    if expected == "completed":
+        num_subtasks = draw(st.integers(min_value=1, max_value=4))
+        statuses = ["completed"] * num_subtasks
+    elif expected == "in_progress":
+        # At least one in_progress, rest can be anything except blocked
+        num_subtasks = draw(st.integers(min_value=2, max_value=4))
+        statuses = draw(st.lists(
+            _UNBLOCKED_STATUS_STRATEGY,
+            min_size=num_subtasks,
+            max_size=num_subtasks,
+        ))
+        slot = draw(st.integers(min_value=0, max_value=num_subtasks - 1))
+        statuses[slot] = draw(_IN_PROGRESS_STATUS_STRATEGY)
+    else:
+        # At least one blocked
+        num_subtasks = draw(st.integers(min_value=2, max_value=4))
+        statuses = ["blocked"] + draw(st.lists(
+            st.sampled_from(["not_started", "in_progress", "completed"]),
+            min_size=num_subtasks - 1,
+            max_size=num_subtasks - 1,
+        ))
+    
+    subtask_ids = [parent_id + _SUFFIX[s - 1] for s in range(1, num_subtasks + 1)]
     tasks = [
         {
             "task_id": parent_id,
@@ -792,13 +822,7 @@ def some_blocked_subtasks_strategy(draw):
         }
     ]
     
-    # At least one blocked
-    for i, sid in enumerate(subtask_ids):
-        if i == 0:
-            status = "blocked"
-        else:
-            status = draw(st.sampled_from(["not_started", "in_progress", "completed"]))
-        
+    for sid, status in zip(subtask_ids, statuses):
         tasks.append({
             "task_id": sid,
             "description": f"Subtask {sid}",
@@ -807,44 +831,23 @@ def some_blocked_subtasks_strategy(draw):
             "subtasks": [],
         })
     
-    return {"tasks": tasks, "parent_id": parent_id}
-
-
-@given(state=all_completed_subtasks_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_2_parent_status_all_completed(state):
-    """
-    Property 2: Parent Status Aggregation - All completed
-    
-    For any parent task where ALL subtasks are completed,
-    update_parent_statuses SHALL set the parent status to "completed".
-    
-    Feature: orchestration-fixes, Property 2
-    Validates: Requirements 1.3
-    """
-    parent_id = state["parent_id"]
-    
-    # Update parent statuses
-    update_parent_statuses(state)
-    
-    # Find parent task
-    parent = next(t for t in state["tasks"] if t["task_id"] == parent_id)
-    
-    assert parent["status"] == "completed", \
-        f"Parent with all completed subtasks should be completed, got {parent['status']}"
+    return {"tasks": tasks, "parent_id": parent_id, "expected": expected}
 
 
-@given(state=some_in_progress_subtasks_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_2_parent_status_in_progress(state):
+@given(state=parent_subtask_scenario_strategy())
+@settings(deadline=None)
+def test_property_2_parent_status_aggregation(state):
     """
-    Property 2: Parent Status Aggregation - In progress
+    Property 2: Parent Status Aggregation
     
-    For any parent task where ANY subtask is in_progress/pending_review/under_review/final_review
-    (and none are blocked), update_parent_statuses SHALL set the parent status to "in_progress".
+    For any parent task, update_parent_statuses SHALL set the parent status to:
+    - "completed" when ALL subtasks are completed
+    - "in_progress" when ANY subtask is in_progress/pending_review/under_review/final_review
+      and none are blocked
+    - "blocked" when ANY subtask is blocked
     
     Feature: orchestration-fixes, Property 2
-    Validates: Requirements 1.4
+    Validates: Requirements 1.3, 1.4, 1.5
     """
     parent_id = state["parent_id"]
     
@@ -852,46 +855,43 @@ def test_property_2_parent_status_in_progress(state):
     update_parent_statuses(state)
     
     # Find parent task
-    parent = next(t for t in state["tasks"] if t["task_id"] == parent_id)
-    
-    # Check if any subtask is blocked (which takes priority)
-    subtask_statuses = [t["status"] for t in state["tasks"] if t.get("parent_id") == parent_id]
-    has_blocked = any(s == "blocked" for s in subtask_statuses)
+    by_id = {t["task_id"]: t for t in state["tasks"]}
+    parent = by_id[parent_id]
     
-    if has_blocked:
-        assert parent["status"] == "blocked", \
-            f"Parent with blocked subtask should be blocked, got {parent['status']}"
-    else:
-        assert parent["status"] == "in_progress", \
-            f"Parent with in_progress subtasks should be in_progress, got {parent['status']}"
+    assert parent["status"] == state["expected"], \
+        f"Parent should be {state['expected']}, got {parent['status']}"
 
 
-@given(state=some_blocked_subtasks_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_2_parent_status_blocked(state):
-    """
-    Property 2: Parent Status Aggregation - Blocked
-    
-    For any parent task where ANY subtask is blocked,
-    update_parent_statuses SHALL set the parent status to "blocked".
-    
-    Feature: orchestration-fixes, Property 2
-    Validates: Requirements 1.5
-    """
-    parent_id = state["parent_id"]
-    
-    # Update parent statuses
-    update_parent_statuses(state)
-    
-    # Find parent task
-    parent = next(t for t in state["tasks"] if t["task_id"] == parent_id)
-    
-    assert parent["status"] == "blocked", \
-        f"Parent with blocked subtask should be blocked, got {parent['status']}"
+def _three_parent_state():
+    """Build a fixed state with three parents, one per aggregation outcome."""
+    subtask_statuses = {
+        "1": ["completed", "completed"],
+        "2": ["in_progress", "blocked", "completed"],
+        "3": ["not_started", "pending_review"],
+    }
+    tasks = []
+    for parent_id, statuses in subtask_statuses.items():
+        subtask_ids = [parent_id + suffix for suffix in _SUFFIX[:len(statuses)]]
+        tasks.append({
+            "task_id": parent_id,
+            "description": f"Parent task {parent_id}",
+            "status": "not_started",
+            "subtasks": subtask_ids,
+        })
+        for sid, status in zip(subtask_ids, statuses):
+            tasks.append({
+                "task_id": sid,
+                "description": f"Subtask {sid}",
+                "status": status,
+                "parent_id": parent_id,
+                "subtasks": [],
+            })
+    return {"tasks": tasks}
 
 
 @given(state=parent_with_subtasks_state_strategy())
-@settings(max_examples=100, deadline=None)
+@example(state=_three_parent_state())
+@settings(deadline=None)
 def test_property_2_parent_status_aggregation_rules(state):
     """
     Property 2: Parent Status Aggregation - Full rules
@@ -908,35 +908,27 @@ def test_property_2_parent_status_aggregation_rules(state):
     # Update parent statuses
     update_parent_statuses(state)
     
-    # Verify each parent task
-    for task in state["tasks"]:
-        subtask_ids = task.get("subtasks", [])
-        if not subtask_ids:
-            continue  # Skip leaf tasks
-        
-        # Get subtask statuses
-        subtask_statuses = []
-        for t in state["tasks"]:
-            if t["task_id"] in subtask_ids:
-                subtask_statuses.append(t["status"])
-        
-        if not subtask_statuses:
-            continue
+    # Group child statuses by parent in one pass, then verify parents only
+    parents = [t for t in state["tasks"] if t.get("subtasks")]
+    children_status = defaultdict(set)
+    for t in state["tasks"]:
+        if (pid := t.get("parent_id")):
+            children_status[pid].add(t["status"])
+    
+    for task in parents:
+        statuses = children_status[task["task_id"]]
         
         # Verify parent status follows the rules
-        if all(s == "completed" for s in subtask_statuses):
-            assert task["status"] == "completed", \
-                f"Parent {task['task_id']} with all completed subtasks should be completed"
-        elif any(s == "blocked" for s in subtask_statuses):
-            assert task["status"] == "blocked", \
-                f"Parent {task['task_id']} with blocked subtask should be blocked"
-        elif any(s == "fix_required" for s in subtask_statuses):
-            assert task["status"] == "fix_required", \
-                f"Parent {task['task_id']} with fix_required subtask should be fix_required"
-        elif any(s in ["in_progress", "pending_review", "under_review", "final_review"] 
-                 for s in subtask_statuses):
-            assert task["status"] == "in_progress", \
-                f"Parent {task['task_id']} with in_progress subtask should be in_progress"
+        if statuses == {"completed"}:
+            expected = "completed"
+        elif "blocked" in statuses:
+            expected = "blocked"
+        elif "fix_required" in statuses:
+            expected = "fix_required"
+        elif statuses & _IN_PROGRESS_STATUSES:
+            expected = "in_progress"
         else:
-            assert task["status"] == "not_started", \
-                f"Parent {task['task_id']} with all not_started subtasks should be not_started"
+            expected = "not_started"
+        
+        assert task["status"] == expected, \
+            f"Parent {task['task_id']} with subtask statuses {sorted(statuses)} should be {expected}, got {task['status']}"
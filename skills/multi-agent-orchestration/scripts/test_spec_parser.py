@@ -8,8 +8,29 @@ Validates: Requirements 1.2, 11.3, 11.4
 """
 
 import string
-from hypothesis import given, strategies as st, settings, assume
-from spec_parser import Task, TaskType, TaskStatus, parse_tasks
+from functools import lru_cache
+
+import pytest
+from hypothesis import given, example, strategies as st, settings, assume
+
+from spec_parser import Task, TaskType, TaskStatus, parse_tasks as _parse_tasks
+
+
+@lru_cache(maxsize=4096)
+def parse_tasks(content):
+    """Memoized parse_tasks for tests; shrinking replays identical inputs.
+    
+    Results are shared between calls, so tests must treat them as read-only.
+    """
+    return _parse_tasks(content)
+
+
+_STATUS_MARKERS = {
+    TaskStatus.NOT_STARTED: "[ ]",
+    TaskStatus.COMPLETED: "[x]",
+    TaskStatus.IN_PROGRESS: "[-]",
+    TaskStatus.BLOCKED: "[~]",
+}
 
 
 @st.composite
@@ -22,88 +43,74 @@ def task_id_strategy(draw):
     return str(major)
 
 
+_TASK_ID_STRATEGY = task_id_strategy()
+
+
 @st.composite
 def task_description_strategy(draw):
     """Generate valid task descriptions"""
     chars = string.ascii_letters + string.digits + " -_.,;:()"
-    desc = draw(st.text(alphabet=chars, min_size=5, max_size=80)).strip()
+    desc = draw(st.text(alphabet=chars, min_size=5, max_size=20)).strip()
     if not desc or desc[0] in "-*#":
         desc = "Task " + desc
     return desc
 
 
-@st.composite
-def task_status_strategy(draw):
-    """Generate valid task status markers"""
-    return draw(st.sampled_from([
-        ("[ ]", TaskStatus.NOT_STARTED),
-        ("[x]", TaskStatus.COMPLETED),
-        ("[-]", TaskStatus.IN_PROGRESS),
-        ("[~]", TaskStatus.BLOCKED),
-    ]))
+_TASK_DESCRIPTION_STRATEGY = task_description_strategy()
 
 
-@st.composite
-def single_task_strategy(draw):
-    """Generate a single valid task"""
-    task_id = draw(task_id_strategy())
-    status_marker, expected_status = draw(task_status_strategy())
-    is_optional = draw(st.booleans())
-    description = draw(task_description_strategy())
-    
-    optional_marker = "*" if is_optional else ""
-    task_line = f"- {status_marker}{optional_marker} {task_id} {description}"
-    
+# Valid (marker, status) pairs
+_TASK_STATUS_STRATEGY = st.sampled_from(
+    [(marker, status) for status, marker in _STATUS_MARKERS.items()]
+)
+
+
+# Statuses that have a tasks.md checkbox marker
+_MARKED_STATUS_STRATEGY = st.sampled_from(tuple(_STATUS_MARKERS))
+
+
+def _task_entry(task_id, status, optional_marker, description):
+    """Build the expected task fields and its tasks.md line."""
     return {
         "task_id": task_id,
         "description": description,
-        "status": expected_status,
-        "is_optional": is_optional,
-        "task_line": task_line,
+        "status": status,
+        "is_optional": optional_marker == "*",
+        "task_line": f"- {_STATUS_MARKERS[status]}{optional_marker} {task_id} {description}",
     }
 
 
+def single_task_strategy(task_id):
+    """Generate a single valid task with the given ID"""
+    return st.builds(
+        _task_entry,
+        st.just(task_id),
+        _MARKED_STATUS_STRATEGY,
+        st.sampled_from(("", "*")),
+        _TASK_DESCRIPTION_STRATEGY,
+    )
+
+
 @st.composite
 def tasks_md_strategy(draw):
     """Generate valid tasks.md content"""
-    num_tasks = draw(st.integers(min_value=1, max_value=8))
+    # Draw distinct IDs up front so colliding IDs never cost a full entry draw
+    task_ids = draw(st.lists(_TASK_ID_STRATEGY, min_size=1, max_size=8, unique=True))
+    expected_tasks = [draw(single_task_strategy(task_id)) for task_id in task_ids]
     
     lines = ["# Tasks", ""]
-    expected_tasks = []
-    used_ids = set()
-    
-    for _ in range(num_tasks):
-        task_data = draw(single_task_strategy())
-        
-        # Ensure unique ID
-        base_id = task_data["task_id"]
-        task_id = base_id
-        counter = 1
-        while task_id in used_ids:
-            task_id = f"{base_id}.{counter}" if "." not in base_id else f"{base_id.split('.')[0]}.{counter}"
-            counter += 1
-        used_ids.add(task_id)
-        
-        # Update task line with unique ID
-        status_markers = {
-            TaskStatus.NOT_STARTED: "[ ]",
-            TaskStatus.COMPLETED: "[x]",
-            TaskStatus.IN_PROGRESS: "[-]",
-            TaskStatus.BLOCKED: "[~]",
-        }
-        optional = "*" if task_data["is_optional"] else ""
-        task_data["task_id"] = task_id
-        task_data["task_line"] = f"- {status_markers[task_data['status']]}{optional} {task_id} {task_data['description']}"
-        
+    for task_data in expected_tasks:
         lines.append(task_data["task_line"])
         lines.append("")
-        expected_tasks.append(task_data)
     
     return {"content": "\n".join(lines), "expected_tasks": expected_tasks}
 
 
-@given(data=tasks_md_strategy())
-@settings(max_examples=100, deadline=None)
+_TASKS_MD_STRATEGY = tasks_md_strategy()
+
+
+@given(data=_TASKS_MD_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_1_task_parsing_round_trip(data):
     """
     Property 1: Task Parsing Round-Trip Consistency
@@ -128,8 +135,9 @@ def test_property_1_task_parsing_round_trip(data):
         assert expected["description"] in parsed.description or parsed.description in expected["description"]
 
 
-@given(task_id=task_id_strategy(), description=task_description_strategy())
-@settings(max_examples=100, deadline=None)
+@given(task_id=_TASK_ID_STRATEGY, description=_TASK_DESCRIPTION_STRATEGY)
+@example(task_id="12.3", description="Implement the request parser (with retries; backoff), logging, metrics and tests")
+@settings(deadline=None, database=None)
 def test_task_id_preservation(task_id, description):
     """Test task IDs are correctly preserved."""
     assume(len(description.strip()) > 0)
@@ -141,8 +149,8 @@ def test_task_id_preservation(task_id, description):
     assert any(t.task_id == task_id for t in result.tasks)
 
 
-@given(status_data=task_status_strategy())
-@settings(max_examples=100, deadline=None)
+@given(status_data=_TASK_STATUS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_status_preservation(status_data):
     """Test status markers are correctly parsed."""
     marker, expected = status_data
@@ -170,31 +178,17 @@ def test_task_id_accepts_trailing_dot():
 if __name__ == "__main__":
     import sys
     
-    print("Running property tests...")
-    print("=" * 50)
-    
-    tests = [
-        ("Property 1: Round-Trip", test_property_1_task_parsing_round_trip),
-        ("Task ID Preservation", test_task_id_preservation),
-        ("Status Preservation", test_status_preservation),
-    ]
-    
-    failed = []
-    for name, test in tests:
-        try:
-            print(f"\n{name}")
-            test()
-            print("  ✅ PASSED")
-        except Exception as e:
-            print(f"  ❌ FAILED: {e}")
-            failed.append((name, e))
-    
-    print("\n" + "=" * 50)
-    if failed:
-        print(f"❌ {len(failed)} failed")
-        sys.exit(1)
+    args = [__file__, "-v", "--hypothesis-show-statistics"]
+    # Tests share no mutable state, so spread them over all cores when
+    # pytest-xdist is available
+    try:
+        import xdist  # noqa: F401
+    except ImportError:  # pragma: no cover
+        pass
     else:
-        print(f"✅ All {len(tests)} tests passed!")
+        args += ["-n", "auto"]
+    
+    sys.exit(pytest.main(args))
 
 
 # ============================================================================
@@ -203,19 +197,33 @@ if __name__ == "__main__":
 # ============================================================================
 
 from spec_parser import (
-    is_leaf_task,
+    is_leaf_task as _is_leaf_task,
     get_ready_tasks,
     is_dispatch_unit,
     get_dispatchable_units,
 )
 
+# id(task) -> (task, is_leaf). Holding the task keeps its id from being reused
+# by a later example while the entry is cached.
+_leaf_cache = {}
 
-@st.composite
-def task_with_subtasks_strategy(draw):
-    """Generate a parent task with subtasks."""
-    parent_id = str(draw(st.integers(min_value=1, max_value=10)))
-    num_subtasks = draw(st.integers(min_value=1, max_value=5))
-    
+
+def is_leaf_task(task):
+    """Memoized is_leaf_task; tasks are not mutated once a test builds them."""
+    hit = _leaf_cache.get(id(task))
+    if hit is None:
+        hit = _leaf_cache[id(task)] = (task, _is_leaf_task(task))
+    return hit[1]
+
+
+@pytest.fixture(autouse=True)
+def _clear_leaf_cache():
+    yield
+    _leaf_cache.clear()
+
+
+def _parent_with_subtasks(parent_id, num_subtasks):
+    """Build a parent task and its leaf subtasks."""
     subtask_ids = [f"{parent_id}.{i}" for i in range(1, num_subtasks + 1)]
     
     parent = Task(
@@ -236,6 +244,18 @@ def task_with_subtasks_strategy(draw):
     return {"parent": parent, "subtasks": subtasks}
 
 
+def task_with_subtasks_strategy():
+    """Generate a parent task with subtasks."""
+    return st.builds(
+        _parent_with_subtasks,
+        st.integers(min_value=1, max_value=10).map(str),
+        st.integers(min_value=1, max_value=5),
+    )
+
+
+_TASK_WITH_SUBTASKS_STRATEGY = task_with_subtasks_strategy()
+
+
 @st.composite
 def mixed_tasks_strategy(draw):
     """Generate a mix of parent tasks and leaf tasks."""
@@ -286,8 +306,11 @@ def mixed_tasks_strategy(draw):
     }
 
 
-@given(data=task_with_subtasks_strategy())
-@settings(max_examples=100, deadline=None)
+_MIXED_TASKS_STRATEGY = mixed_tasks_strategy()
+
+
+@given(data=_TASK_WITH_SUBTASKS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_1_leaf_task_filtering_parent_excluded(data):
     """
     Property 1: Leaf Task Filtering - Parent tasks excluded
@@ -320,8 +343,8 @@ def test_property_1_leaf_task_filtering_parent_excluded(data):
         assert subtask.task_id in ready_ids, f"Subtask {subtask.task_id} should be in ready tasks"
 
 
-@given(data=mixed_tasks_strategy())
-@settings(max_examples=100, deadline=None)
+@given(data=_MIXED_TASKS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_1_leaf_task_filtering_only_leaves_ready(data):
     """
     Property 1: Leaf Task Filtering - Only leaf tasks in ready list
@@ -335,6 +358,7 @@ def test_property_1_leaf_task_filtering_only_leaves_ready(data):
     tasks = data["tasks"]
     parent_ids = data["parent_ids"]
     leaf_ids = data["leaf_ids"]
+    leaf_flags = {t.task_id: is_leaf_task(t) for t in tasks}
     
     # Get ready tasks with no completed tasks
     ready = get_ready_tasks(tasks, set())
@@ -345,16 +369,16 @@ def test_property_1_leaf_task_filtering_only_leaves_ready(data):
         assert pid not in ready_ids, f"Parent task {pid} should not be in ready tasks"
     
     # All ready tasks should be leaf tasks
-    for task in ready:
-        assert is_leaf_task(task), f"Ready task {task.task_id} should be a leaf task"
+    for tid in ready_ids:
+        assert leaf_flags[tid], f"Ready task {tid} should be a leaf task"
     
     # All leaf tasks (without dependencies) should be ready
     for lid in leaf_ids:
         assert lid in ready_ids, f"Leaf task {lid} should be in ready tasks"
 
 
-@given(data=mixed_tasks_strategy())
-@settings(max_examples=100, deadline=None)
+@given(data=_MIXED_TASKS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_1_leaf_task_completed_excluded(data):
     """
     Property 1: Leaf Task Filtering - Completed tasks excluded
@@ -428,8 +452,11 @@ def dispatch_unit_task_strategy(draw):
     return {"task": task, "expected": expected}
 
 
-@given(data=dispatch_unit_task_strategy())
-@settings(max_examples=100, deadline=None)
+_DISPATCH_UNIT_TASK_STRATEGY = dispatch_unit_task_strategy()
+
+
+@given(data=_DISPATCH_UNIT_TASK_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_1_dispatch_unit_identification(data):
     """
     Property 1: Dispatch Unit Selection - Identification
@@ -445,8 +472,8 @@ def test_property_1_dispatch_unit_identification(data):
     assert is_dispatch_unit(task) == expected
 
 
-@given(data=mixed_tasks_strategy())
-@settings(max_examples=100, deadline=None)
+@given(data=_MIXED_TASKS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_1_dispatch_unit_selection_only_parents_and_standalone(data):
     """
     Property 1: Dispatch Unit Selection - Only parent/standalone tasks dispatchable
@@ -474,6 +501,19 @@ def test_property_1_dispatch_unit_selection_only_parents_and_standalone(data):
 from spec_parser import expand_dependencies
 
 
+def _compute_parent_to_leaves(task_map):
+    """Map every parent task ID to its leaf descendants in one pass.
+    
+    Deeper IDs are visited first, so each parent reuses the leaf lists already
+    computed for its subtasks instead of walking its subtree again.
+    """
+    leaves = {}
+    for tid in sorted(task_map, key=lambda t: t.count("."), reverse=True):
+        subtasks = task_map[tid].subtasks
+        leaves[tid] = [leaf for sid in subtasks for leaf in leaves[sid]] if subtasks else [tid]
+    return {tid: leaves[tid] for tid, task in task_map.items() if task.subtasks}
+
+
 @st.composite
 def nested_task_hierarchy_strategy(draw):
     """Generate a nested task hierarchy with parent-subtask relationships."""
@@ -482,19 +522,17 @@ def nested_task_hierarchy_strategy(draw):
     
     all_tasks = []
     task_map = {}
-    parent_to_leaves = {}  # Maps parent_id to all leaf task IDs under it
     
     for p in range(1, num_parents + 1):
         parent_id = str(p)
         num_subtasks = draw(st.integers(min_value=1, max_value=3))
         subtask_ids = []
-        leaf_ids = []
         
         for s in range(1, num_subtasks + 1):
             subtask_id = f"{parent_id}.{s}"
             
-            # Optionally create nested subtasks (e.g., 1.1.1)
-            if draw(st.booleans()) and draw(st.booleans()):
+            # Optionally create nested subtasks (e.g., 1.1.1), one time in four
+            if draw(st.integers(min_value=0, max_value=3)) == 0:
                 # Create nested subtasks
                 num_nested = draw(st.integers(min_value=1, max_value=2))
                 nested_ids = [f"{subtask_id}.{n}" for n in range(1, num_nested + 1)]
@@ -518,7 +556,6 @@ def nested_task_hierarchy_strategy(draw):
                     )
                     all_tasks.append(nested_task)
                     task_map[nid] = nested_task
-                    leaf_ids.append(nid)
             else:
                 # Create leaf subtask
                 subtask = Task(
@@ -529,7 +566,6 @@ def nested_task_hierarchy_strategy(draw):
                 all_tasks.append(subtask)
                 task_map[subtask_id] = subtask
                 subtask_ids.append(subtask_id)
-                leaf_ids.append(subtask_id)
         
         # Create parent task
         parent = Task(
@@ -539,7 +575,13 @@ def nested_task_hierarchy_strategy(draw):
         )
         all_tasks.append(parent)
         task_map[parent_id] = parent
-        parent_to_leaves[parent_id] = leaf_ids
+    
+    # Maps each top-level parent_id to all leaf task IDs under it
+    parent_to_leaves = {
+        tid: leaves
+        for tid, leaves in _compute_parent_to_leaves(task_map).items()
+        if task_map[tid].parent_id is None
+    }
     
     return {
         "tasks": all_tasks,
@@ -548,17 +590,19 @@ def nested_task_hierarchy_strategy(draw):
     }
 
 
+_NESTED_TASK_HIERARCHY_STRATEGY = nested_task_hierarchy_strategy()
+
+
 @st.composite
 def task_with_parent_dependency_strategy(draw):
     """Generate a task that depends on a parent task."""
-    hierarchy = draw(nested_task_hierarchy_strategy())
+    hierarchy = draw(_NESTED_TASK_HIERARCHY_STRATEGY)
     task_map = hierarchy["task_map"]
     parent_to_leaves = hierarchy["parent_to_leaves"]
     
     # Pick a parent task to depend on
     parent_ids = list(parent_to_leaves.keys())
-    if not parent_ids:
-        return None
+    assume(parent_ids)
     
     dep_parent_id = draw(st.sampled_from(parent_ids))
     expected_leaves = parent_to_leaves[dep_parent_id]
@@ -578,8 +622,11 @@ def task_with_parent_dependency_strategy(draw):
     }
 
 
-@given(data=task_with_parent_dependency_strategy())
-@settings(max_examples=100, deadline=None)
+_TASK_WITH_PARENT_DEPENDENCY_STRATEGY = task_with_parent_dependency_strategy()
+
+
+@given(data=_TASK_WITH_PARENT_DEPENDENCY_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_3_dependency_expansion_parent_to_leaves(data):
     """
     Property 3: Dependency Expansion - Parent expands to leaves
@@ -590,9 +637,6 @@ def test_property_3_dependency_expansion_parent_to_leaves(data):
     Feature: orchestration-fixes, Property 3
     Validates: Requirements 1.6, 1.7, 5.1, 5.2
     """
-    if data is None:
-        return  # Skip if no valid data generated
-    
     task_map = data["task_map"]
     dependent = data["dependent"]
     dep_parent_id = data["dep_parent_id"]
@@ -611,83 +655,51 @@ def test_property_3_dependency_expansion_parent_to_leaves(data):
         f"Expected leaves {expected_leaves}, got {expanded_set}"
 
 
-@given(hierarchy=nested_task_hierarchy_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_3_dependency_expansion_leaf_unchanged(hierarchy):
+@given(hierarchy=_NESTED_TASK_HIERARCHY_STRATEGY)
+@settings(deadline=None, database=None)
+def test_property_3_dependency_expansion_hierarchy(hierarchy):
     """
-    Property 3: Dependency Expansion - Leaf tasks unchanged
+    Property 3: Dependency Expansion - Hierarchy invariants
     
-    For any leaf task dependency, expand_dependencies SHALL return
-    the same leaf task ID unchanged.
-    
-    Feature: orchestration-fixes, Property 3
-    Validates: Requirements 5.3
-    """
-    task_map = hierarchy["task_map"]
+    For any nested task hierarchy:
+    - expand_dependencies SHALL return a leaf task ID unchanged
+    - expand_dependencies SHALL return a list with no duplicate task IDs
+    - get_dispatchable_units SHALL NOT return a task depending on a parent
+      until ALL subtasks of the parent are completed
     
-    # Find all leaf tasks
-    leaf_ids = [tid for tid, task in task_map.items() if is_leaf_task(task)]
-    
-    if not leaf_ids:
-        return  # Skip if no leaf tasks
-    
-    # Expand each leaf task dependency
-    for leaf_id in leaf_ids:
-        expanded = expand_dependencies([leaf_id], task_map)
-        assert expanded == [leaf_id], \
-            f"Leaf task {leaf_id} should remain unchanged, got {expanded}"
-
-
-@given(hierarchy=nested_task_hierarchy_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_3_dependency_expansion_no_duplicates(hierarchy):
-    """
-    Property 3: Dependency Expansion - No duplicates
-    
-    For any set of dependencies, expand_dependencies SHALL return
-    a list with no duplicate task IDs.
+    The three checks share one generated hierarchy per example.
     
     Feature: orchestration-fixes, Property 3
-    Validates: Requirements 5.1, 5.2
+    Validates: Requirements 1.6, 1.7, 5.1, 5.2, 5.3, 5.4, 5.5
     """
     task_map = hierarchy["task_map"]
     parent_to_leaves = hierarchy["parent_to_leaves"]
     
-    # Create dependencies with potential duplicates
-    # (e.g., depend on parent and one of its subtasks)
-    all_ids = list(task_map.keys())
-    if len(all_ids) < 2:
-        return
-    
-    # Pick multiple dependencies that might overlap
-    deps = list(set(all_ids[:min(3, len(all_ids))]))
-    
-    expanded = expand_dependencies(deps, task_map)
-    
-    # Check no duplicates
-    assert len(expanded) == len(set(expanded)), \
-        f"Expanded dependencies contain duplicates: {expanded}"
-
-
-@given(hierarchy=nested_task_hierarchy_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_3_dependency_expansion_ready_waits_for_all_subtasks(hierarchy):
-    """
-    Property 3: Dependency Expansion - Ready waits for all subtasks
+    # Leaf tasks unchanged
+    leaf_flags = {tid: is_leaf_task(task) for tid, task in task_map.items()}
+    leaf_ids = [tid for tid, is_leaf in leaf_flags.items() if is_leaf]
     
-    For any task depending on a parent, get_dispatchable_units SHALL NOT return
-    that task until ALL subtasks of the parent are completed.
+    # One call covers every leaf: expansion keeps order, so any leaf that
+    # changed would show up as a mismatch at its position
+    expanded = expand_dependencies(leaf_ids, task_map)
+    assert expanded == leaf_ids, \
+        f"Leaf tasks {leaf_ids} should remain unchanged, got {expanded}"
     
-    Feature: orchestration-fixes, Property 3
-    Validates: Requirements 1.6, 1.7, 5.4, 5.5
-    """
-    task_map = hierarchy["task_map"]
-    parent_to_leaves = hierarchy["parent_to_leaves"]
+    # No duplicates: pick multiple dependencies that might overlap
+    # (e.g., depend on parent and one of its subtasks)
+    all_ids = list(task_map.keys())
+    if len(all_ids) >= 2:
+        deps = list(set(all_ids[:min(3, len(all_ids))]))
+        
+        expanded = expand_dependencies(deps, task_map)
+        
+        assert len(expanded) == len(set(expanded)), \
+            f"Expanded dependencies contain duplicates: {expanded}"
     
+    # Ready waits for all subtasks of the first parent
     if not parent_to_leaves:
         return
     
-    # Pick a parent to depend on
     parent_id = list(parent_to_leaves.keys())[0]
     expected_leaves = parent_to_leaves[parent_id]
     
@@ -701,25 +713,17 @@ def test_property_3_dependency_expansion_ready_waits_for_all_subtasks(hierarchy)
         dependencies=[parent_id],
     )
     
-    all_tasks = list(task_map.values()) + [dependent]
+    all_tasks = (*task_map.values(), dependent)
     
-    # With no completions, dependent should NOT be dispatchable
-    dispatchable = get_dispatchable_units(all_tasks, set())
-    dispatchable_ids = {t.task_id for t in dispatchable}
-    assert "99" not in dispatchable_ids, "Dependent should not be ready with no completions"
-    
-    # With partial completions, dependent should NOT be ready
-    if len(expected_leaves) > 1:
-        partial = set(expected_leaves[:-1])  # All but one
-        dispatchable = get_dispatchable_units(all_tasks, partial)
-        dispatchable_ids = {t.task_id for t in dispatchable}
-        assert "99" not in dispatchable_ids, "Dependent should not be ready with partial completions"
-    
-    # With all subtasks completed, dependent SHOULD be ready
-    all_completed = set(expected_leaves)
-    dispatchable = get_dispatchable_units(all_tasks, all_completed)
-    dispatchable_ids = {t.task_id for t in dispatchable}
-    assert "99" in dispatchable_ids, "Dependent should be ready when all subtasks completed"
+    # The dependent is ready exactly when every required leaf is completed:
+    # none, all but one (when that differs from none), then all of them
+    required = frozenset(expected_leaves)
+    partial = set(expected_leaves[:-1])
+    cases = (set(), partial, set(required)) if partial else (set(), set(required))
+    for completed in cases:
+        dispatchable_ids = {t.task_id for t in get_dispatchable_units(all_tasks, completed)}
+        assert ("99" in dispatchable_ids) == (required <= completed), \
+            f"Dependent readiness wrong with {len(completed)}/{len(required)} subtasks completed"
 
 
 # ============================================================================
@@ -751,18 +755,22 @@ def file_path_strategy(draw):
     return filename
 
 
+_FILE_PATH_STRATEGY = file_path_strategy()
+
+
+_FILE_PATH_POOL_STRATEGY = st.lists(_FILE_PATH_STRATEGY, min_size=0, max_size=10, unique=True)
+
+
 @st.composite
 def file_manifest_strategy(draw):
     """Generate task details with file manifest markers."""
-    # Generate writes list
-    num_writes = draw(st.integers(min_value=0, max_value=5))
-    writes = [draw(file_path_strategy()) for _ in range(num_writes)]
-    writes = list(dict.fromkeys(writes))  # Remove duplicates
-    
-    # Generate reads list
-    num_reads = draw(st.integers(min_value=0, max_value=5))
-    reads = [draw(file_path_strategy()) for _ in range(num_reads)]
-    reads = list(dict.fromkeys(reads))  # Remove duplicates
+    # Draw one pool of distinct paths and slice writes and reads out of it.
+    # The slices may overlap, so a path can be both written and read.
+    pool = draw(_FILE_PATH_POOL_STRATEGY)
+    num_writes = draw(st.integers(min_value=0, max_value=min(5, len(pool))))
+    writes = pool[:num_writes]
+    read_start = draw(st.integers(min_value=0, max_value=len(pool)))
+    reads = pool[read_start:read_start + 5]
     
     # Build details list
     details = []
@@ -785,7 +793,7 @@ def file_manifest_strategy(draw):
         details.append(f"_reads: {reads_str}")
     
     # Shuffle details to test order independence
-    draw(st.randoms()).shuffle(details)
+    details = draw(st.permutations(details))
     
     return {
         "details": details,
@@ -794,8 +802,16 @@ def file_manifest_strategy(draw):
     }
 
 
-@given(data=file_manifest_strategy())
-@settings(max_examples=100, deadline=None)
+_FILE_MANIFEST_STRATEGY = file_manifest_strategy()
+
+
+@given(data=_FILE_MANIFEST_STRATEGY)
+@example(data={
+    "details": ["_writes: src/app.py, src/db.py", "_reads: src/db.py, config.json"],
+    "expected_writes": ["src/app.py", "src/db.py"],
+    "expected_reads": ["src/db.py", "config.json"],
+})
+@settings(max_examples=200, deadline=None, database=None)
 def test_property_4_file_manifest_parsing_round_trip(data):
     """
     Property 4: File Manifest Parsing Round-Trip
@@ -807,27 +823,27 @@ def test_property_4_file_manifest_parsing_round_trip(data):
     Validates: Requirements 2.2
     """
     details = data["details"]
-    expected_writes = set(data["expected_writes"])
-    expected_reads = set(data["expected_reads"])
+    expected_writes = frozenset(data["expected_writes"])
+    expected_reads = frozenset(data["expected_reads"])
     
     # Extract file manifest
     writes, reads = _extract_file_manifest(details)
     
     # Verify writes match
-    assert set(writes) == expected_writes, \
-        f"Expected writes {expected_writes}, got {set(writes)}"
+    assert frozenset(writes) == expected_writes, \
+        f"Expected writes {sorted(expected_writes)}, got {writes}"
     
     # Verify reads match
-    assert set(reads) == expected_reads, \
-        f"Expected reads {expected_reads}, got {set(reads)}"
+    assert frozenset(reads) == expected_reads, \
+        f"Expected reads {sorted(expected_reads)}, got {reads}"
 
 
 @st.composite
 def task_with_manifest_md_strategy(draw):
     """Generate tasks.md content with file manifests."""
-    task_id = draw(task_id_strategy())
-    description = draw(task_description_strategy())
-    manifest = draw(file_manifest_strategy())
+    task_id = draw(_TASK_ID_STRATEGY)
+    description = draw(_TASK_DESCRIPTION_STRATEGY)
+    manifest = draw(_FILE_MANIFEST_STRATEGY)
     
     # Build task markdown
     lines = [
@@ -850,8 +866,11 @@ def task_with_manifest_md_strategy(draw):
     }
 
 
-@given(data=task_with_manifest_md_strategy())
-@settings(max_examples=100, deadline=None)
+_TASK_WITH_MANIFEST_MD_STRATEGY = task_with_manifest_md_strategy()
+
+
+@given(data=_TASK_WITH_MANIFEST_MD_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_4_file_manifest_in_parsed_task(data):
     """
     Property 4: File Manifest in Parsed Task
@@ -872,14 +891,21 @@ def test_property_4_file_manifest_in_parsed_task(data):
     assert task is not None, f"Task {data['task_id']} not found"
     
     # Verify writes and reads
-    assert set(task.writes) == set(data["expected_writes"]), \
+    assert frozenset(task.writes) == frozenset(data["expected_writes"]), \
         f"Expected writes {data['expected_writes']}, got {task.writes}"
-    assert set(task.reads) == set(data["expected_reads"]), \
+    assert frozenset(task.reads) == frozenset(data["expected_reads"]), \
         f"Expected reads {data['expected_reads']}, got {task.reads}"
 
 
-@given(details=st.lists(st.text(min_size=0, max_size=100), min_size=0, max_size=10))
-@settings(max_examples=100, deadline=None)
+@pytest.mark.parametrize("details", [
+    [],
+    [""],
+    ["   ", "\t"],
+    ["just text", "more text"],
+    [":not a marker", "writes: src/a.py", "reads: src/b.py"],
+    ["see _writes: src/a.py", "_writes src/a.py", "_readsrc/b.py"],
+    ["Ünïcødé ñøïsé", "→ _reads: ←"],
+])
 def test_property_4_file_manifest_no_markers_empty(details):
     """
     Property 4: File Manifest - No markers returns empty lists
@@ -890,14 +916,7 @@ def test_property_4_file_manifest_no_markers_empty(details):
     Feature: orchestration-fixes, Property 4
     Validates: Requirements 2.2
     """
-    # Filter out any details that accidentally contain markers
-    filtered_details = [
-        d for d in details 
-        if not d.strip().lower().startswith('_writes:') 
-        and not d.strip().lower().startswith('_reads:')
-    ]
-    
-    writes, reads = _extract_file_manifest(filtered_details)
+    writes, reads = _extract_file_manifest(details)
     
     assert writes == [], f"Expected empty writes, got {writes}"
     assert reads == [], f"Expected empty reads, got {reads}"
@@ -907,8 +926,8 @@ def test_property_4_file_manifest_no_markers_empty(details):
 def multiple_manifest_markers_strategy(draw):
     """Generate details with multiple _writes: or _reads: markers."""
     # Generate two sets of files
-    files1 = [draw(file_path_strategy()) for _ in range(draw(st.integers(min_value=1, max_value=3)))]
-    files2 = [draw(file_path_strategy()) for _ in range(draw(st.integers(min_value=1, max_value=3)))]
+    files1 = [draw(_FILE_PATH_STRATEGY) for _ in range(draw(st.integers(min_value=1, max_value=3)))]
+    files2 = [draw(_FILE_PATH_STRATEGY) for _ in range(draw(st.integers(min_value=1, max_value=3)))]
     
     # Create details with multiple markers
     details = [
@@ -926,8 +945,11 @@ def multiple_manifest_markers_strategy(draw):
     }
 
 
-@given(data=multiple_manifest_markers_strategy())
-@settings(max_examples=100, deadline=None)
+_MULTIPLE_MANIFEST_MARKERS_STRATEGY = multiple_manifest_markers_strategy()
+
+
+@given(data=_MULTIPLE_MANIFEST_MARKERS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_4_file_manifest_multiple_markers_combined(data):
     """
     Property 4: File Manifest - Multiple markers combined
@@ -939,12 +961,12 @@ def test_property_4_file_manifest_multiple_markers_combined(data):
     Validates: Requirements 2.2
     """
     details = data["details"]
-    expected_writes = set(data["expected_writes"])
+    expected_writes = frozenset(data["expected_writes"])
     
     writes, reads = _extract_file_manifest(details)
     
-    assert set(writes) == expected_writes, \
-        f"Expected writes {expected_writes}, got {set(writes)}"
+    assert frozenset(writes) == expected_writes, \
+        f"Expected writes {sorted(expected_writes)}, got {writes}"
 
 
 # ============================================================================
@@ -957,57 +979,35 @@ def test_property_4_file_manifest_multiple_markers_combined(data):
 from spec_parser import TaskStatus, VALID_TRANSITIONS, validate_transition
 
 
-@st.composite
-def status_strategy(draw):
-    """Generate valid task statuses."""
-    return draw(st.sampled_from(list(VALID_TRANSITIONS.keys())))
+_STATUSES = tuple(VALID_TRANSITIONS.keys())
 
 
-@st.composite
-def valid_transition_strategy(draw):
-    """Generate a valid state transition."""
-    from_status = draw(status_strategy())
-    valid_targets = VALID_TRANSITIONS.get(from_status, [])
-    
-    if not valid_targets:
-        # No valid transitions from this state, try another
-        from_status = draw(st.sampled_from([s for s in VALID_TRANSITIONS.keys() if VALID_TRANSITIONS[s]]))
-        valid_targets = VALID_TRANSITIONS[from_status]
-    
-    to_status = draw(st.sampled_from(valid_targets))
-    return {"from": from_status, "to": to_status}
+_STATUS_STRATEGY = st.sampled_from(_STATUSES)
 
 
-@st.composite
-def invalid_transition_strategy(draw):
-    """Generate an invalid state transition."""
-    from_status = draw(status_strategy())
-    valid_targets = set(VALID_TRANSITIONS.get(from_status, []))
-    all_statuses = set(VALID_TRANSITIONS.keys())
-    
-    # Invalid targets are all statuses except valid ones
-    invalid_targets = all_statuses - valid_targets - {from_status}
-    
-    if not invalid_targets:
-        # All transitions are valid from this state, try another
-        for s in VALID_TRANSITIONS.keys():
-            valid = set(VALID_TRANSITIONS.get(s, []))
-            invalid = all_statuses - valid - {s}
-            if invalid:
-                from_status = s
-                invalid_targets = invalid
-                break
-    
-    if not invalid_targets:
-        return None  # No invalid transitions possible
-    
-    to_status = draw(st.sampled_from(list(invalid_targets)))
-    return {"from": from_status, "to": to_status}
-
-
-@given(transition=valid_transition_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_8_valid_transitions_accepted(transition):
+# The transition space is small and finite, so enumerate it exhaustively
+# instead of sampling it
+_VALID_TRANSITION_CASES = sorted(
+    (from_status, to_status)
+    for from_status, targets in VALID_TRANSITIONS.items()
+    for to_status in targets
+)
+_INVALID_TARGETS = {
+    from_status: tuple(
+        to_status for to_status in _STATUSES
+        if to_status != from_status and to_status not in VALID_TRANSITIONS[from_status]
+    )
+    for from_status in _STATUSES
+}
+_INVALID_TRANSITION_CASES = sorted(
+    (from_status, to_status)
+    for from_status, targets in _INVALID_TARGETS.items()
+    for to_status in targets
+)
+
+
+@pytest.mark.parametrize("from_status,to_status", _VALID_TRANSITION_CASES)
+def test_property_8_valid_transitions_accepted(from_status, to_status):
     """
     Property 8: Fix Loop State Transitions - Valid transitions accepted
     
@@ -1017,14 +1017,13 @@ def test_property_8_valid_transitions_accepted(transition):
     Feature: orchestration-fixes, Property 8
     Validates: Requirements 4.2, 4.3, 4.4, 4.5
     """
-    result = validate_transition(transition["from"], transition["to"])
+    result = validate_transition(from_status, to_status)
     assert result is True, \
-        f"Valid transition {transition['from']} -> {transition['to']} should be accepted"
+        f"Valid transition {from_status} -> {to_status} should be accepted"
 
 
-@given(transition=invalid_transition_strategy())
-@settings(max_examples=100, deadline=None)
-def test_property_8_invalid_transitions_rejected(transition):
+@pytest.mark.parametrize("from_status,to_status", _INVALID_TRANSITION_CASES)
+def test_property_8_invalid_transitions_rejected(from_status, to_status):
     """
     Property 8: Fix Loop State Transitions - Invalid transitions rejected
     
@@ -1034,15 +1033,12 @@ def test_property_8_invalid_transitions_rejected(transition):
     Feature: orchestration-fixes, Property 8
     Validates: Requirements 4.5
     """
-    if transition is None:
-        return  # Skip if no invalid transition could be generated
-    
-    result = validate_transition(transition["from"], transition["to"])
+    result = validate_transition(from_status, to_status)
     assert result is False, \
-        f"Invalid transition {transition['from']} -> {transition['to']} should be rejected"
+        f"Invalid transition {from_status} -> {to_status} should be rejected"
 
 
-@settings(max_examples=1, deadline=None)
+@settings(max_examples=1, deadline=None, database=None)
 @given(st.just(None))
 def test_property_8_fix_required_transitions_specific(_):
     """
@@ -1074,7 +1070,7 @@ def test_property_8_fix_required_transitions_specific(_):
         "blocked -> fix_required should be valid"
 
 
-@settings(max_examples=1, deadline=None)
+@settings(max_examples=1, deadline=None, database=None)
 @given(st.just(None))
 def test_property_8_fix_required_invalid_transitions_specific(_):
     """
@@ -1106,8 +1102,8 @@ def test_property_8_fix_required_invalid_transitions_specific(_):
         "completed -> fix_required should be invalid"
 
 
-@given(from_status=status_strategy())
-@settings(max_examples=100, deadline=None)
+@given(from_status=_STATUS_STRATEGY)
+@settings(deadline=None, database=None)
 def test_property_8_completed_is_terminal(from_status):
     """
     Property 8: Fix Loop State Transitions - Completed is terminal
@@ -1128,7 +1124,7 @@ def test_property_8_completed_is_terminal(from_status):
         pass  # Covered by other tests
     else:
         # Test that we can't go FROM completed to anything
-        for to_status in VALID_TRANSITIONS.keys():
+        for to_status in _STATUSES:
             assert not validate_transition("completed", to_status), \
                 f"completed -> {to_status} should be invalid"
 
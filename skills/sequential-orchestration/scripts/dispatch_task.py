@@ -94,6 +94,15 @@ def _resolve_timeout_seconds(default_seconds: int) -> int:
         return default_seconds
 
 
+def _build_assignment_env(assign_backend: str, assign_opencode_agent: str) -> Dict[str, str]:
+    env = os.environ.copy()
+    if sys.platform.startswith("win") and "CODEAGENT_NO_TMUX" not in env:
+        env["CODEAGENT_NO_TMUX"] = "1"
+    if assign_backend == "opencode":
+        env["CODEAGENT_OPENCODE_AGENT"] = assign_opencode_agent
+    return env
+
+
 def build_bulk_assignment_prompt(tasks_md_path: str, dispatch_unit_ids: List[str]) -> str:
     """
     Build prompt for sub-agent to assign dispatch units.
@@ -184,11 +193,7 @@ def ensure_assignments(
     cwd = workdir or os.getcwd()
     tasks_ref = _safe_relpath(tasks_md_path, cwd)
     prompt = build_bulk_assignment_prompt(tasks_ref, missing)
-    env = os.environ.copy()
-    if sys.platform.startswith("win") and "CODEAGENT_NO_TMUX" not in env:
-        env["CODEAGENT_NO_TMUX"] = "1"
-    if assign_backend == "opencode":
-        env["CODEAGENT_OPENCODE_AGENT"] = assign_opencode_agent
+    env = _build_assignment_env(assign_backend, assign_opencode_agent)
     
     try:
         result = subprocess.run(
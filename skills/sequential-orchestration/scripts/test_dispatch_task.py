@@ -36,6 +36,18 @@ def test_ensure_assignments_preserves_existing_and_fills_missing_without_wrapper
     assert result["2"]["owner_agent"] == "codex"
 
 
+def test_build_assignment_env_sets_opencode_agent(monkeypatch):
+    import dispatch_task
+
+    monkeypatch.delenv("CODEAGENT_OPENCODE_AGENT", raising=False)
+
+    env = dispatch_task._build_assignment_env("opencode", "gawain")
+    assert env["CODEAGENT_OPENCODE_AGENT"] == "gawain"
+
+    env = dispatch_task._build_assignment_env("codex", "gawain")
+    assert "CODEAGENT_OPENCODE_AGENT" not in env
+
+
 def test_ensure_assignments_sets_opencode_agent_env(monkeypatch):
     import dispatch_task
 